@@ -32,7 +32,6 @@ Requires
 sqlite3 (standard)
 datetime (standard)
 os (standard)
-glob (standard)
 
 Classes
 ------
@@ -46,32 +45,103 @@ Variables
 import sqlite3
 import datetime
 import os
-import glob
+import atexit
+import threading
 
 current_db = None
 dbconfig = {
     'enable': True,
     'renew': True,
+    # trade some durability for write throughput, see `_apply_pragmas`
+    'pragma_fast': True,
 }
 
+# buffered log rows waiting for a batched insert, see `DatabaseProxy.log`;
+# the buffer is shared by all threads, so appends and flushes go through
+# `_buf_lock` — an unguarded flush could interleave with appends and
+# drop rows, or run twice and insert the same batch twice
+_log_buffer = []
+_buf_lock = threading.Lock()
+_BUF_MAX = 1024
+
+# lazily opened per-thread connections, see `get_conn`
+_local = threading.local()
+
+# single constant SQL string so sqlite reuses the cached prepared statement
+_LOG_SQL = 'INSERT INTO log (object_type,object_id,message) VALUES (?,?,?);'
+
+
+def get_conn():
+    """
+    Return this thread's connection to `current_db`, opening on first use
+
+    Connections live in a `threading.local` and remember the pid they were
+    opened in, so threads and forked multiprocessing workers each get
+    their own handle instead of sharing (or re-opening) one. Connections
+    are opened in autocommit mode (`isolation_level=None`); transactions
+    around batched inserts are managed explicitly in
+    `DatabaseProxy.flush`.
+    """
+
+    conn = getattr(_local, 'conn', None)
+    if conn is None or _local.pid != os.getpid():
+        conn = sqlite3.connect(
+            current_db, check_same_thread=False, isolation_level=None
+        )
+        if dbconfig['pragma_fast']:
+            _apply_pragmas(conn)
+        _local.conn = conn
+        _local.pid = os.getpid()
+    return conn
+
+
+def close_db():
+    """
+    Flush pending log rows and close this thread's connection
+    """
+
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        DatabaseProxy(conn).flush()
+        conn.close()
+        _local.conn = None
+
 
 class CurrentDb():
     """
-    Connect to current database and return cursor to this database
+    Provide a `DatabaseProxy` over the shared connection to current database
     """
     def __init__(self):
         """This class provides access to the database"""
         self.current_db = current_db
 
     def __enter__(self):
-        """Connect to database and return cursor"""
-        self.con = sqlite3.connect(current_db)
-        return DatabaseProxy(self.con)
+        """Return proxy over the shared database connection"""
+        self.proxy = DatabaseProxy(get_conn())
+        return self.proxy
 
     def __exit__(self, type, value, traceback):
-        """Close database connection when done"""
-        self.con.commit()
-        self.con.close()
+        """Flush buffered log rows; the shared connection stays open"""
+        self.proxy.flush()
+
+
+def _apply_pragmas(con):
+    """
+    Tune connection PRAGMAs for the write-heavy logging workload
+
+    WAL journal and `synchronous=NORMAL` remove the fsync-per-commit cost
+    of the defaults; the rest enlarge cache and keep temporaries in memory.
+    Disable via ``dbconfig['pragma_fast'] = False`` to restore full
+    durability.
+    """
+
+    con.execute('PRAGMA journal_mode=WAL;')
+    con.execute('PRAGMA synchronous=NORMAL;')
+    con.execute('PRAGMA cache_size=-65536;')
+    con.execute('PRAGMA temp_store=MEMORY;')
+    con.execute('PRAGMA mmap_size=268435456;')
+    # keep the WAL bounded when several writers share the file
+    con.execute('PRAGMA wal_autocheckpoint=1000;')
 
 
 class DatabaseProxy():
@@ -84,6 +154,7 @@ class DatabaseProxy():
         """
         self.conn = conn
         self.cursor = conn.cursor()
+        self._log_sql = _LOG_SQL
 
     def log(self, msg, obj_type='sys', obj_id=0):
         """
@@ -99,13 +170,56 @@ class DatabaseProxy():
             message to put into log
         """
 
-        if len(obj_type) > 3:
-            raise ValueError('`obj_type` must be exactly 3 symbols')
-        self.cursor.execute(
-            'INSERT INTO log (object_type,object_id,message)'
-            'VALUES (?,?,?);',
-            (obj_type, obj_id, msg)
-        )
+        # `obj_type` length is enforced by a CHECK constraint in schema.sql,
+        # so the hot path carries no per-call validation
+        # buffer the row: a single executemany per batch is much cheaper
+        # than one INSERT round-trip per call. The flush itself runs
+        # outside the lock so it can retake it without deadlocking
+        with _buf_lock:
+            _log_buffer.append((obj_type, obj_id, msg))
+            full = len(_log_buffer) >= _BUF_MAX
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Insert all buffered log rows with a single `executemany`
+
+        The buffer lock is held across the insert, so concurrent flushes
+        serialize instead of writing the same rows twice.
+        """
+
+        with _buf_lock:
+            if not _log_buffer:
+                return
+            # IMMEDIATE takes the write lock up front so concurrent
+            # writers fail fast instead of deadlocking on lock upgrade
+            self.cursor.execute('BEGIN IMMEDIATE;')
+            try:
+                self.cursor.executemany(self._log_sql, _log_buffer)
+            except Exception:
+                # drop the bad batch so the connection is usable again
+                self.cursor.execute('ROLLBACK;')
+                _log_buffer.clear()
+                raise
+            self.cursor.execute('COMMIT;')
+            _log_buffer.clear()
+
+
+# schema text cached after the first read, see `_get_schema`
+_schema = None
+
+
+def _get_schema():
+    """
+    Return schema.sql contents, reading the file only once per process
+    """
+
+    global _schema
+    if _schema is None:
+        with open('schema.sql', 'r') as f:
+            _schema = f.read()
+    return _schema
 
 
 def new_db():
@@ -114,20 +228,42 @@ def new_db():
     new filename
     """
     global current_db
-    current = datetime.datetime.now()
+    # drop the shared connection so it reopens against the new file
+    close_db()
     filename = os.path.join(
         os.getcwd(), 'db',
-        '{0:04}{1:02}{2:02}_{3:02}{4:02}.db'.format(
-            current.year, current.month, current.day,
-            current.hour, current.minute
-        )
+        datetime.datetime.now().strftime('%Y%m%d_%H%M') + '.db'
     )
-    # create new database file
-    open(filename, 'w+')
+    # unlink any same-name database and its WAL/SHM sidecars left by an
+    # unclean shutdown: truncating the main file next to a stale journal
+    # would let sqlite replay old pages into (or lock) the fresh database
+    for stale in (filename, filename + '-wal', filename + '-shm'):
+        try:
+            os.remove(stale)
+        except FileNotFoundError:
+            pass
+    # create new database file; close right away so the handle is not
+    # left to the garbage collector
+    open(filename, 'wb').close()
     current_db = filename
-    schema = open('schema.sql', 'r').read()
     with CurrentDb() as db:
-        db.cursor.execute(schema)
+        db.cursor.execute(_get_schema())
+
+
+def flush_log():
+    """
+    Flush any buffered log rows to the current database
+
+    Call at simulation end; also registered with `atexit` so buffered rows
+    are not lost on interpreter shutdown.
+    """
+
+    if current_db and _log_buffer:
+        with CurrentDb() as db:
+            db.flush()
+
+
+atexit.register(flush_log)
 
 
 def clean_db():
@@ -136,7 +272,13 @@ def clean_db():
     """
 
     i = 0
-    for dbfile in glob.glob(os.path.join(os.getcwd(), 'db', '*.db')):
-        i += 1
-        os.remove(dbfile)
+    # scandir avoids fnmatch per entry and the intermediate list that
+    # glob builds; WAL journals leave -wal/-shm sidecars next to each
+    # database, remove those too
+    suffixes = ('.db', '.db-wal', '.db-shm')
+    with os.scandir(os.path.join(os.getcwd(), 'db')) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffixes) and entry.is_file():
+                os.remove(entry.path)
+                i += 1
     print('{0} files deleted'.format(i))
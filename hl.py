@@ -50,9 +50,21 @@ units: str (default 's')
     minutes, hours, days or other.
 """
 
-import json
+try:
+    import orjson as json
+except ImportError:
+    # orjson is optional, stdlib json is a drop-in fallback here
+    import json
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; without it net_from_json parses the whole file
+    # in memory instead of streaming it
+    ijson = None
+import numpy as np
 import tpnet
 from collections import deque
+from itertools import chain
 
 config = {
     'evalt': 1000,
@@ -61,28 +73,235 @@ config = {
 }
 
 
-def net_from_json(netfile):
+def _soa_arrays(vertnames, insides, carsontrack):
     """
-    Creates Net from JSON file
+    Pack per-vertex loader lists into structure-of-arrays form
+
+    Returns a contiguous numpy view of the loaded net: vertex names as an
+    object array, per-vertex passenger counts, and the ontrack payload as
+    a ragged CSR pair (indptr, data). Downstream numeric code can scan
+    these without chasing per-vertex Python objects.
+
+    Returns
+    ------
+    names: numpy.ndarray (object)
+        vertex names by vertex index.
+    inside_counts: numpy.ndarray (int32)
+        amount of starting passengers per vertex.
+    ontrack_indptr: numpy.ndarray (int32)
+        CSR row pointers into `ontrack_data`, length len(vertnames)+1.
+    ontrack_data: numpy.ndarray (object)
+        concatenated ontrack entries of all vertices.
+    """
+    n = len(vertnames)
+    names = np.array(vertnames, dtype=object)
+    inside_counts = np.fromiter(
+        (len(d) for d in insides), dtype=np.int32, count=n
+    )
+    ontrack_indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(
+        np.fromiter((len(d) for d in carsontrack), dtype=np.int32, count=n),
+        out=ontrack_indptr[1:]
+    )
+    ontrack_data = np.array(
+        list(chain.from_iterable(carsontrack)), dtype=object
+    )
+    return names, inside_counts, ontrack_indptr, ontrack_data
+
+
+# generated edge builders cached by the target key of the edge dicts,
+# see `_build_edges`
+_edge_builders = {}
+
+_EDGE_BUILDER_SRC = """\
+def build(netdict):
+    edges = []
+    append = edges.append
+    for vert in netdict:
+        name = vert['name']
+        for edge in vert['edges']:
+            append((name, edge[{key!r}]))
+    return edges
+"""
+
+
+def _build_edges(netdict):
+    """
+    Build the (source name, target name) edge list from parsed net dicts
+
+    The JSON shape is fixed within a run, so on first call the edge target
+    key is learned from the data and a straight-line builder specialized
+    for it is compiled with `exec` and cached. The generated loop hoists
+    the source-name lookup and the append method out of the inner loop.
+    """
+    for vert in netdict:
+        if vert['edges']:
+            key = 't' if 't' in vert['edges'][0] else next(
+                iter(vert['edges'][0])
+            )
+            break
+    else:
+        return []
+    if key not in _edge_builders:
+        namespace = {}
+        exec(compile(
+            _EDGE_BUILDER_SRC.format(key=key), '<edge builder>', 'exec'
+        ), namespace)
+        _edge_builders[key] = namespace['build']
+    return _edge_builders[key](netdict)
+
+
+def net_from_csv(netfile):
+    """
+    Creates Net from CSV file
+
+    CSV parses faster than the JSON equivalent and is handy for nets
+    exported from spreadsheets. Expected format is one row per vertex:
+
+        name,target1;target2;...
+
+    where the second column lists edge target vertex names separated by
+    semicolons (may be empty). Vertices start with empty `inside` and
+    `ontrack` deques.
 
     Arguments
     -------
     netfile: str
-        JSON file that contains transport net description. For example see
-        example_net.json file.
+        CSV file that contains transport net description.
+    """
+    import csv
+
+    vertnames = []
+    edges = []
+    with open(netfile, newline='') as f:
+        for row in csv.reader(f):
+            if not row:
+                continue
+            name = row[0]
+            vertnames.append(name)
+            if len(row) > 1 and row[1]:
+                edges.extend((name, t) for t in row[1].split(';'))
+    insides = [deque([]) for _ in vertnames]
+    carsontrack = [deque([]) for _ in vertnames]
+    return tpnet.Net(
+        len(vertnames), vertnames, edges,
+        inside=insides, ontrack=carsontrack
+    )
+
+
+def net_from_msgpack(netfile):
+    """
+    Creates Net from MessagePack file
+
+    MessagePack deserializes several times faster than textual JSON and the
+    payload is smaller, which helps when the same net is loaded for many
+    scenario runs. Requires `msgspec`. Use `json_to_msgpack` to convert an
+    existing JSON net description once.
+
+    Arguments
+    -------
+    netfile: str
+        MessagePack file that contains transport net description with the
+        same structure as the JSON format (see example_net.json).
     """
-    netdict = json.loads(open(netfile).read())
+    import msgspec
+
+    class EdgeSchema(msgspec.Struct):
+        t: str
+        w: float = 1
+
+    class VertSchema(msgspec.Struct):
+        name: str
+        loadargs: list = []
+        inside: list = []
+        ontrack: list = []
+        edges: list[EdgeSchema] = []
+
+    decoder = msgspec.msgpack.Decoder(type=list[VertSchema])
+    with open(netfile, 'rb') as f:
+        netlist = decoder.decode(f.read())
     vertnames = []
     insides = []
     carsontrack = []
     edges = []
-    for vert in netdict:
-        vertnames.append(vert['name'])
-        insides.append(deque(vert['inside']))
-        carsontrack.append(deque(vert['ontrack']))
-        for edge in vert['edges']:
-            edges.append((vert['name'], edge['t']))
+    for vert in netlist:
+        vertnames.append(vert.name)
+        insides.append(deque(vert.inside))
+        carsontrack.append(deque(vert.ontrack))
+        for edge in vert.edges:
+            edges.append((vert.name, edge.t))
     return tpnet.Net(
         len(vertnames), vertnames, edges,
         inside=insides, ontrack=carsontrack
     )
+
+
+def json_to_msgpack(jsonfile, mpkfile):
+    """
+    One-shot converter from JSON net description to MessagePack
+
+    Arguments
+    -------
+    jsonfile: str
+        JSON file that contains transport net description.
+    mpkfile: str
+        destination MessagePack file for use with `net_from_msgpack`.
+    """
+    import msgspec
+
+    with open(jsonfile, 'rb') as f:
+        netdict = json.loads(f.read())
+    with open(mpkfile, 'wb') as f:
+        f.write(msgspec.msgpack.encode(netdict))
+
+
+def net_from_json(netfile):
+    """
+    Creates Net from JSON file
+
+    Arguments
+    -------
+    netfile: str
+        JSON file that contains transport net description. For example see
+        example_net.json file.
+    """
+    if ijson is not None:
+        # stream vertices one by one so the whole parsed document never
+        # sits in memory at once
+        vertnames = []
+        insides = []
+        carsontrack = []
+        edges = []
+        with open(netfile, 'rb') as f:
+            for vert in ijson.items(f, 'item'):
+                vertnames.append(vert['name'])
+                # the vertex deques must stay unbounded: boarding bulk-
+                # extends them, and a maxlen deque silently drops from
+                # the left instead of rejecting the overflow
+                insides.append(deque(vert['inside']))
+                carsontrack.append(deque(vert['ontrack']))
+                edges.extend(
+                    (vert['name'], edge['t']) for edge in vert['edges']
+                )
+    else:
+        # orjson consumes bytes directly, skipping the decode pass stdlib
+        # does
+        with open(netfile, 'rb') as f:
+            netdict = json.loads(f.read())
+        # comprehensions avoid the per-iteration append lookups of the
+        # naive four-list loop
+        vertnames = [vert['name'] for vert in netdict]
+        # unbounded deques, see the streaming branch above
+        insides = [deque(vert['inside']) for vert in netdict]
+        carsontrack = [deque(vert['ontrack']) for vert in netdict]
+        edges = _build_edges(netdict)
+    net = tpnet.Net(
+        len(vertnames), vertnames, edges,
+        inside=insides, ontrack=carsontrack
+    )
+    # expose SoA views of the loaded state for numeric post-processing
+    (net.names_arr, net.inside_counts,
+     net.ontrack_indptr, net.ontrack_data) = _soa_arrays(
+        vertnames, insides, carsontrack
+    )
+    return net
@@ -1,6 +1,6 @@
 CREATE TABLE log(
   id integer UNIQUE PRIMARY KEY AUTOINCREMENT,
-  object_type char(3) NOT NULL DEFAULT 'sys',
+  object_type char(3) NOT NULL DEFAULT 'sys' CHECK(length(object_type) <= 3),
   object_id integer NOT NULL DEFAULT 0,
   message text NOT NULL
 );
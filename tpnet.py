@@ -28,7 +28,6 @@ TODO: write description
 
 Requires
 ------
-random (standard)
 collections (standard)
 numpy
 graph_tool
@@ -42,15 +41,41 @@ Car - class that navigates Net and transfers Passenger
 Passenger - class that represents a passenger
 """
 
-import random
+import sys
+import warnings
 from collections import deque
+from itertools import count, islice
 import numpy as np
 import graph_tool as gt
+import graph_tool.topology
 
 from db import new_db, CurrentDb
 
+# set to False to skip database logging together with the cost of
+# building the log messages themselves
+LOG_ENABLED = True
+
+# whether the missing-database warning has fired, see `_warn_no_database`
+_nodb_warned = False
+
+
+def _warn_no_database():
+    """
+    Warn that a log message was dropped for lack of a database proxy
+
+    Logging is optional, so running without a database is legitimate
+    (headless sweeps); warn once per process instead of aborting the
+    caller the way the old ``raise RuntimeWarning`` did.
+    """
+    global _nodb_warned
+    if not _nodb_warned:
+        _nodb_warned = True
+        warnings.warn(
+            'cannot log message: database cursor is not provided',
+            RuntimeWarning, stacklevel=3
+        )
+
 
-# TODO: remove vload, it duplicates vinside
 class Net:
     """
     Transport network class
@@ -60,18 +85,22 @@ class Net:
     g: graph_tool.Graph
         `Graph` object that contains all information about network.
     vname: graph_tool.PropertyMap (type: string)
-        vertex names. Might be absent if no names were provided to constructor.
+        vertex names, built lazily on first access. Raises AttributeError
+        if no names were provided to constructor. Hot paths read names
+        through the `_vname_arr` numpy mirror instead.
     namelup: dict
         dictionary that provides index lookup by name.
     vloadargs: graph_tool.PropertyMap (type: vector<float>)
         attributes of function for periodic load change.
-    vinside: graph_tool.PropertyMap (type: object)
-        deque of `Passenger` objects inside of each `g` vertex.
-    vontrack: graph_tool.PropertyMap (type: object)
-        deque of `Car` objects inside of each `g` vertex.
-    venroute: graph_tool.PropertyMap (type: object)
-        deque of `Car` objects in transition between vertices (on edges of
-        `g`).
+    vinside: list(collections.deque)
+        deque of `Passenger` objects inside of each `g` vertex, indexed by
+        vertex index.
+    vontrack: list(collections.deque)
+        deque of `Car` objects inside of each `g` vertex, indexed by vertex
+        index.
+    venroute: dict((int, int): collections.deque)
+        deque of `Car` objects in transition between vertices, keyed by
+        (source, target) vertex indices of the edge.
     allcars: dict
         dictionary that contains all spawned `Car` objects
     allpassengers: dict
@@ -130,6 +159,11 @@ class Net:
             Starting cars in transition between vertices.  Must be an iterable
             that contains starting edge vertex, ending edge vertex and a deque
             with `Car` objects. Default: collections.deque([]).
+        precompute_routes: bool
+            if True, run one shortest-path search per vertex at
+            construction and keep the V×V predecessor table, so
+            `get_route` never searches again. Worth it for small nets
+            queried many times; costs O(size²) memory. Default: False.
 
         """
 
@@ -137,71 +171,189 @@ class Net:
         self.g.add_vertex(size)
         self.allcars = {}
         self.allpassengers = {}
+        self._nv = size
+        self._rng = np.random.default_rng()
+        # current tick number; cars remember the tick they last moved
+        # in, which replaces per-car lock flags (see `move_cars`)
+        self._step_no = 0
+        # memoized routes keyed by (source, target); the graph and weights
+        # are fixed after construction, so entries never go stale
+        self._route_cache = {}
+        # Dijkstra predecessor maps keyed by source vertex, one shortest
+        # path tree serves every destination from that source
+        self._pred_cache = {}
         new_db()
 
+        # graph_tool keeps one std::string per vertex in a 'string'
+        # property; the simulation itself only needs the numpy name
+        # array and the lookup dict, so the PropertyMap is built lazily
+        # on first access (e.g. for drawing)
+        self._vname_pm = None
         if names:
-            self.vname = self.g.new_vertex_property('string')
-            for item, name in zip(self.g.vertices(), names):
-                self.vname[item] = name
+            # interned names compare by pointer first, so the namelup
+            # probes done for name-routed cars skip the character-wise
+            # string comparison
+            names = [sys.intern(name) for name in names]
             self.namelup = {
                 key: value
                 for (key, value) in zip(names, self.g.get_vertices())
             }
+            # read-only name lookup used by logging/stats hot paths;
+            # indexing a numpy array skips the PropertyMap dispatch
+            self._vname_arr = np.fromiter(
+                names, dtype='U{}'.format(max(map(len, names))), count=size
+            )
+        # one dict probe resolves indices, numeric strings and names;
+        # names take precedence over numeric strings on collision
+        self._resolve_tab = {i: i for i in range(size)}
+        for i in range(size):
+            self._resolve_tab[str(i)] = i
+        if names:
+            for i, name in enumerate(names):
+                self._resolve_tab[name] = i
         if edges:
-            edges_indexed = [
-                (self.namelup[name1], self.namelup[name2])
-                for name1, name2 in edges
-            ]
+            # translate the whole edge list with vectorized probes into
+            # a sorted name table instead of one dict lookup per endpoint
+            flat = np.asarray(edges).reshape(-1)
+            order = np.argsort(self._vname_arr)
+            pos = np.searchsorted(self._vname_arr, flat, sorter=order)
+            idx = order[np.minimum(pos, size - 1)]
+            bad = self._vname_arr[idx] != flat
+            if bad.any():
+                raise KeyError(
+                    'nonexistant vertex name {}'.format(flat[bad][0])
+                )
+            edges_indexed = idx.reshape(-1, 2).astype(np.int32)
         else:
             if 'max_random_edges' in kwargs:
-                max_edges = range(kwargs['max_random_edges'])
+                max_edges = kwargs['max_random_edges']
             else:
-                max_edges = range(size*2)
-            random_edges = [
-                random.sample(range(size), 2) for _ in max_edges
-            ]
-            edges_indexed = [
-                (first, second)
-                for first, second in random_edges
-            ]
-        self.g.add_edge_list(edges_indexed)
-
-        if 'loadargs' in kwargs:
-            self.vloadargs = self.g.new_vertex_property('vector<float>')
-            for v, la in zip(self.g.vertices(), kwargs['loadargs']):
-                self.vloadargs[v] = la
-
+                max_edges = size*2
+            # draw all pairs in one numpy call and mask out self-loops,
+            # oversampling so enough pairs survive the rejection
+            pairs = self._rng.integers(0, size, size=(max_edges*2, 2))
+            pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+            # drop duplicate pairs: parallel edges would only bloat every
+            # later per-tick edge traversal. unique() returns the pairs
+            # lexicographically sorted, so truncating it directly would
+            # keep only the lowest-index sources; pick the surviving
+            # edges through a random permutation instead
+            pairs = np.unique(pairs, axis=0)
+            keep = self._rng.permutation(len(pairs))[:max_edges]
+            edges_indexed = pairs[keep]
+        # hand the weight column to add_edge_list so the edge array and
+        # the weights are written in a single C++ pass over the input
         self.vweight = self.g.new_edge_property('float')
         if 'weight' in kwargs:
-            for e, w in zip(self.g.edges(), kwargs['weight']):
-                self.vweight[e] = w
+            weights = np.fromiter(
+                kwargs['weight'], dtype=np.float64, count=len(edges_indexed)
+            )
         else:
-            for e in self.g.edges():
-                self.vweight[e] = 1
+            weights = np.ones(len(edges_indexed), dtype=np.float64)
+        self.g.add_edge_list(
+            np.column_stack([edges_indexed, weights]), eprops=[self.vweight]
+        )
+        # with all-unit weights Dijkstra degenerates to BFS; remember it
+        # so route searches can skip the priority queue entirely
+        self._uniform_weight = 'weight' not in kwargs
+
+        if 'loadargs' in kwargs:
+            self.vloadargs = self.g.new_vertex_property('vector<float>')
+            # single C-level copy instead of a per-vertex Python loop
+            self.vloadargs.set_2d_array(
+                np.asarray(kwargs['loadargs'], dtype=np.float64).T
+            )
 
-        self.vinside = self.g.new_vertex_property('object')
+        # optional V×V predecessor table: one Dijkstra per source at
+        # construction buys an O(path length) walk per query with no
+        # further shortest-path calls. Worth it for small nets queried
+        # many times; costs O(V²) memory
+        self._pred_table = None
+        if kwargs.get('precompute_routes'):
+            w = None if self._uniform_weight else self.vweight
+            self._pred_table = np.empty((size, size), dtype=np.int32)
+            for s in range(size):
+                _, pred = gt.topology.shortest_distance(
+                    self.g, source=s, weights=w, pred_map=True)
+                self._pred_table[s] = pred.a
+
+        # plain Python containers indexed by vertex index / edge pair:
+        # object-typed PropertyMaps would route every access through a
+        # C++ map lookup although graph_tool never consumes them itself
         if 'inside' in kwargs:
-            for v, i in zip(self.g.vertices(), kwargs['inside']):
-                self.vinside[v] = i
+            self.vinside = list(kwargs['inside'])
         else:
-            for v in self.g.vertices():
-                self.vinside[v] = deque([])
+            self.vinside = [deque([]) for _ in range(size)]
 
-        self.vontrack = self.g.new_vertex_property('object')
         if 'ontrack' in kwargs:
-            for v, o in zip(self.g.vertices(), kwargs['ontrack']):
-                self.vontrack[v] = o
+            self.vontrack = list(kwargs['ontrack'])
         else:
-            for v in self.g.vertices():
-                self.vontrack[v] = deque([])
-
-        self.venroute = self.g.new_edge_property('object')
+            self.vontrack = [deque([]) for _ in range(size)]
+
+        # vertex index array fetched once; per-tick loops iterate this
+        # instead of asking graph_tool to rebuild it every call. The
+        # graph does not mutate after construction
+        self._V = self.g.get_vertices()
+        # out-neighbor sets for O(1) membership checks in move_cars
+        self._adj = [
+            set(self.g.get_out_neighbors(v).tolist())
+            for v in self._V
+        ]
+
+        self.venroute = {
+            (int(vin), int(vout)): deque([])
+            for vin, vout in edges_indexed
+        }
+        # incoming edge keys grouped by target vertex, so move_cars can
+        # drain a vertex's in-edges and dispatch it in the same sweep
+        self._in_pairs = [[] for _ in range(size)]
+        for pair in self.venroute:
+            self._in_pairs[pair[1]].append(pair)
         if 'enroute' in kwargs:
             for vin, vout, ed in kwargs['enroute']:
-                self.venroute[self.g.edge(vin, vout)] = ed
-        else:
-            for e in self.g.edges():
-                self.venroute[e] = deque([])
+                self.venroute[(int(vin), int(vout))] = ed
+
+    @property
+    def vname(self):
+        """
+        Vertex-name PropertyMap, built on first access
+
+        Only needed for graph_tool interop such as drawing; internal code
+        reads names from `_vname_arr` and resolves them via `namelup`.
+        """
+        if self._vname_pm is None:
+            if not hasattr(self, '_vname_arr'):
+                raise AttributeError(
+                    'no vertex names were provided to constructor'
+                )
+            self._vname_pm = self.g.new_vertex_property(
+                'string', vals=self._vname_arr
+            )
+        return self._vname_pm
+
+    def _resolve(self, vert):
+        """
+        Translates vertex name to vertex index; indices pass through.
+
+        A single probe into the combined lookup table covers names,
+        indices and numeric strings; the isinstance checks only run on
+        the miss path to pick the right error.
+        """
+        try:
+            idx = self._resolve_tab.get(vert)
+        except TypeError:
+            idx = None
+        if idx is not None:
+            return idx
+        if isinstance(vert, (int, np.integer)):
+            # out-of-range indices pass through as before
+            return int(vert)
+        if isinstance(vert, str):
+            raise KeyError('nonexistant vertex name {}'.format(vert))
+        raise TypeError(
+            'expected vertex name or vertex index. '
+            'got {}'.format(type(vert))
+        )
 
     def get_route(self, src, dst, **kwargs):
         """
@@ -216,59 +368,96 @@ class Net:
 
         Kwargs
         ------
-        none yet.
+        max_radius: float
+            bound the search to this distance from `src`. Much cheaper
+            when `dst` is known to be nearby; falls back to the full
+            search if `dst` lies outside the radius. Default: None.
 
         Returns
         ------
-        route: collections.deque
-            deque of vertex indices of the route from `src` to `dst`.
+        route: tuple
+            vertex indices of the route from `src` to `dst`. The tuple is
+            shared between callers and must not be mutated; Car and
+            Passenger read it through a cursor without copying.
         """
 
         # separate checks to allow source and destination to be
         # type-independant
-        try:
-            source = int(src)
-        except ValueError:
-            source = self.namelup[src]
-        except TypeError:
-            raise TypeError(
-                'expected source to be vertex name or vertex index. '
-                'got {}'.format(type(src))
-            )
-        try:
-            target = int(dst)
-        except ValueError:
-            target = self.namelup[dst]
-        except TypeError:
-            raise TypeError(
-                'expected destination to be vertex name or vertex index. '
-                'got {}'.format(type(src))
-            )
-
-        route = deque([target])
-        sg = gt.search.dijkstra_iterator(
-            self.g, self.vweight, source=source, array=True)
-        while route[0] != source:
-            found = False
-            for check_src, check_dest in sg:
-                if check_dest == target:
-                    route.appendleft(check_src)
-                    target = check_src
-                    found = True
-            if not found:
-                raise RuntimeError('cannot find route')
+        source = self._resolve(src)
+        target = self._resolve(dst)
+
+        cached = self._route_cache.get((source, target))
+        if cached is not None:
+            # routes are immutable, every caller shares the same tuple
+            return cached
+
+        max_radius = kwargs.get('max_radius')
+        if max_radius is not None:
+            # a bounded search settles only the neighborhood of the
+            # source; any route it does find is still shortest
+            w = None if self._uniform_weight else self.vweight
+            _, pred = gt.topology.shortest_distance(
+                self.g, source=source, weights=w, max_dist=max_radius,
+                pred_map=True)
+            route = self._walk_pred(pred, source, target)
+            if route is not None:
+                self._route_cache[(source, target)] = route
+                return route
+            # target outside the radius - fall through to a full search
+
+        if self._pred_table is not None:
+            pred = self._pred_table[source]
+        else:
+            pred = self._pred_cache.get(source)
+            if pred is None:
+                # unweighted nets get a plain BFS instead of Dijkstra
+                w = None if self._uniform_weight else self.vweight
+                _, pred = gt.topology.shortest_distance(
+                    self.g, source=source, weights=w, pred_map=True)
+                self._pred_cache[source] = pred
+        # walk predecessors from target back to source, O(path length)
+        route = self._walk_pred(pred, source, target)
+        if route is None:
+            raise RuntimeError('cannot find route')
+        self._route_cache[(source, target)] = route
+        # every suffix of a shortest path is itself a shortest path, so
+        # seed the cache for intermediate origins to the same target
+        for i in range(1, len(route) - 1):
+            key = (route[i], target)
+            if key not in self._route_cache:
+                self._route_cache[key] = route[i:]
         return route
 
+    def _walk_pred(self, pred, source, target):
+        """
+        Walks predecessors from `target` back to `source`.
+
+        Returns the route tuple, or None if `target` was never reached
+        (unreached vertices point at themselves in the predecessor map).
+        """
+        route = [target]
+        v = target
+        while v != source:
+            prev = int(pred[v])
+            if prev == v:
+                return None
+            route.append(prev)
+            v = prev
+        return tuple(reversed(route))
+
     def move_cars(self, unlock=True, **kwargs):
         """
         Evaluates all vertices and attempts to move `Car` object in `vontrack`
         deque along their paths.
 
-        Moves `Car` objects in two steps. First, checks the edges for cars in
-        transition. Any cars found will be transferred to according vertices
-        and locked.  At second step checks the vertices for cars that can move
-        along route.    If found, transfers them to according edge and locks
-        them. After finishing, if `unlock` is True, unlocks all cars.
+        Sweeps the vertices once. For each vertex, first drains its
+        incoming edges: cars found in transition are transferred into the
+        vertex and stamped with the current tick. Then checks the vertex
+        for cars that can move along route; if found, transfers them to
+        according edge and stamps them. The stamp keeps every car to one
+        move per tick whatever order vertices are visited in, and
+        advancing the tick counter at the end stands in for unlocking
+        every car individually.
 
         Stuck cars raise RuntimeError and are despawned after. If car reaches
         destination, print message and despawn car.
@@ -276,7 +465,8 @@ class Net:
         Arguments
         ------
         unlock: bool
-            if True, unlocks all cars after moving. Default: True.
+            if True, advances the tick counter after moving so all cars
+            may move again on the next call. Default: True.
 
         Kwargs
         ------
@@ -296,15 +486,24 @@ class Net:
         nuffin.
         """
 
+        # hot attributes bound once per call: the per-car loops below
+        # then read locals instead of repeating the attribute lookups
+        vontrack = self.vontrack
+        venroute = self.venroute
+        vname_arr = self._vname_arr
+        adj = self._adj
+        allcars = self.allcars
+        step = self._step_no
+
         def move_cars_to_vertices(database=None):
             # TODO: write docstring
             nextvert = car.take_next()
             if car.namelup:
                 nextvert = self.namelup[nextvert]
-            self.vontrack[nextvert].append(car)
+            vontrack[nextvert].append(car)
             # if db is not provided, `chcur` will raise warning
-            car.chcur(nextvert, self.vname[nextvert], database=db)
-            car.can_move = False
+            car.chcur(nextvert, vname_arr[nextvert], database=db)
+            car.last_moved = step
 
         def move_cars_to_edges(database=None):
             # TODO: write docstring
@@ -316,70 +515,90 @@ class Net:
                 # car reached destination
                 if 'silent' not in kwargs:
                     print(
-                        'Car {0} reached destination at {1}: {2}'.format(
-                            car.id, v, self.vname[v]
-                        )
+                        f'Car {car.id} reached destination '
+                        f'at {v}: {vname_arr[v]}'
                     )
                 # put message in log as car
-                db.log(
-                    'i reached destination at {0}: {1}'.format(
-                        v, self.vname[v]
-                    ), 'car', car.id
-                )
-                self.allcars.pop(car.id)
+                if LOG_ENABLED:
+                    db.log(
+                        f'i reached destination at {v}: '
+                        f'{vname_arr[v]}', 'car', car.id
+                    )
+                allcars.pop(car.id)
             else:
-                # since graph is not directional, doesn't matter if we
-                # use get_in_neighbors or get_out_neighbors
-                # CHANGED in v0.1.1: graph is directional now, so we
-                # have to use `Graph.get_out_neighbors`
-                neighbors = self.g.get_out_neighbors(self.g.vertex(v))
-                if nextvert in neighbors:
-                    e = self.g.edge(v, nextvert)
-                    self.venroute[e].append(car)
+                # graph is directional since v0.1.1, so only
+                # out-neighbors are valid next hops
+                if nextvert in adj[v]:
+                    venroute[(int(v), int(nextvert))].append(car)
                     car.chcur(
-                        '{0}-{1}'.format(v, nextvert),
-                        '{0}-{1}'.format(
-                            self.vname[v],
-                            self.vname[nextvert]
-                        ), update_inside=False, database=db
+                        f'{v}-{nextvert}',
+                        f'{vname_arr[v]}-{vname_arr[nextvert]}',
+                        update_inside=False, database=db
                     )
-                    car.can_move = False
+                    car.last_moved = step
                     # TODO: notify car passengers that it arrived to
                     # next station
                 else:
                     raise RuntimeWarning(
-                        'car#{0} is stuck at vertex {1}: {2}'.format(
-                            car.id, v, self.vname[v]
-                        )
+                        f'car#{car.id} is stuck at vertex '
+                        f'{v}: {vname_arr[v]}'
                     )
                     db.log(
-                        'i am stuck at vertex {1}: {2}'.format(
-                            car.id, v, self.vname[v]
-                        ), 'car', car.id
+                        f'i am stuck at vertex {v}: {vname_arr[v]}',
+                        'car', car.id
                     )
 
         with CurrentDb() as db:
-            for e in self.g.edges():
-                for _ in range(len(self.venroute[e])):
-                    car = self.venroute[e].popleft()
-                    if car.can_move:
-                        move_cars_to_vertices(database=db)
-                    else:
-                        self.venroute[e].append(car)
-            for v in self.g.get_vertices():
-                for _ in range(len(self.vontrack[v])):
-                    car = self.vontrack[v].popleft()
-                    if car.can_move:
-                        move_cars_to_edges(database=db)
-                    else:
-                        self.vontrack[v].append(car)
-            # unlock all cars for next step
-            for v in self.g.vertices():
-                for car in self.vontrack[v]:
-                    car.can_move = True
-            for e in self.g.edges():
-                for car in self.venroute[e]:
-                    car.can_move = True
+            # one sweep per vertex: drain its incoming edges, then
+            # dispatch it. The can_move lock keeps a car to one move per
+            # tick regardless of sweep order, and each deque is
+            # partitioned in one pass instead of rotated with
+            # popleft/append per car
+            for v in self._V:
+                for pair in self._in_pairs[v]:
+                    enroute = venroute[pair]
+                    if not enroute:
+                        continue
+                    staying = []
+                    seen = 0
+                    try:
+                        for car in enroute:
+                            seen += 1
+                            if car.last_moved != step:
+                                move_cars_to_vertices(database=db)
+                            else:
+                                staying.append(car)
+                    finally:
+                        # finalize the partition even if a car raised:
+                        # the unexamined tail stays put and the raising
+                        # car leaves the deque, exactly as the old
+                        # popleft loop left things. Without this, cars
+                        # already dispatched this sweep would survive in
+                        # both containers and move twice on later ticks
+                        if seen < len(enroute):
+                            staying.extend(islice(enroute, seen, None))
+                        enroute.clear()
+                        enroute.extend(staying)
+                ontrack = vontrack[v]
+                staying = []
+                seen = 0
+                try:
+                    for car in ontrack:
+                        seen += 1
+                        if car.last_moved != step:
+                            move_cars_to_edges(database=db)
+                        else:
+                            staying.append(car)
+                finally:
+                    # same exception-safe finalize as the enroute drain
+                    if seen < len(ontrack):
+                        staying.extend(islice(ontrack, seen, None))
+                    ontrack.clear()
+                    ontrack.extend(staying)
+            # advancing the tick counter makes every stamp stale, which
+            # is the O(1) equivalent of unlocking each car
+            if unlock:
+                self._step_no = step + 1
 
     def spawn_car(self, target, **kwargs):
         """
@@ -412,45 +631,40 @@ class Net:
         nuffin.
         """
 
-        try:
-            target = int(target)
-        except ValueError:
-            # assume it is vertex name
-            try:
-                target = self.namelup[target]
-            except KeyError:
-                raise KeyError('nonexistant vertex name {}'.format(target))
-        except TypeError:
-            raise TypeError(
-                'target expected to be iter(str) or iter(int). '
-                'got {}'.format(type(target))
-            )
+        target = self._resolve(target)
         if 'amount' in kwargs:
             amount = kwargs.pop('amount')
         else:
             amount = 1
+        # a fixed route/destination is the same for every spawned car, so
+        # resolve it once outside the loop
+        if 'route' in kwargs:
+            route = kwargs['route']
+        elif 'dst' in kwargs:
+            route = self.get_route(target, kwargs.pop('dst'))
+        else:
+            route = None
         with CurrentDb() as db:
             for _ in range(amount):
-                if 'route' in kwargs:
-                    route = kwargs['route']
-                elif 'dst' in kwargs:
-                    route = self.get_route(target, kwargs.pop('dst'))
+                if route is None:
+                    # draw from [0, nv-1) and shift past `target`:
+                    # uniform over the other vertices, no O(V) copies
+                    dst = int(self._rng.integers(0, self._nv - 1))
+                    dst += dst >= target
+                    car = Car(self.get_route(target, dst))
                 else:
-                    dst = np.random.choice(
-                        np.delete(self.g.get_vertices(), target)
-                    )
-                    route = self.get_route(target, dst)
+                    # routes are immutable, all cars share the storage
+                    car = Car(route)
                 # TODO: make sure all kwargs are passed to cars properly
-                car = Car(route)
                 self.vontrack[target].append(car)
                 self.allcars[car.id] = car
-                db.log(
-                    'created at {0}: {1} with destination {2}: {3}'.format(
-                        target, self.vname[target],
-                        car.get_last(), self.vname[car.get_last()]
-                    ),
-                    'car', car.id
-                )
+                if LOG_ENABLED:
+                    last = car.get_last()
+                    db.log(
+                        f'created at {target}: {self._vname_arr[target]} '
+                        f'with destination {last}: {self._vname_arr[last]}',
+                        'car', car.id
+                    )
 
     def spawn_random_cars(self, amount):
         """
@@ -466,22 +680,24 @@ class Net:
         """
 
         with CurrentDb() as db:
-            for _ in range(amount):
-                target = np.random.choice(self.g.get_vertices())
-                dst = np.random.choice(
-                    np.delete(self.g.get_vertices(), target)
-                )
+            # draw every endpoint pair in two vectorized calls; dst
+            # comes from [0, nv-1) and shifts past its src, so pairs are
+            # uniform over distinct vertices with no per-spawn rng calls
+            srcs = self._rng.integers(0, self._nv, size=amount)
+            dsts = self._rng.integers(0, self._nv - 1, size=amount)
+            dsts += dsts >= srcs
+            for target, dst in zip(srcs.tolist(), dsts.tolist()):
                 route = self.get_route(target, dst)
                 car = Car(route)
                 self.vontrack[target].append(car)
                 self.allcars[car.id] = car
-                db.log(
-                    'created at {0}: {1} with destination {2}: {3}'.format(
-                        target, self.vname[target],
-                        car.get_last(), self.vname[car.get_last()]
-                    ),
-                    'car', car.id
-                )
+                if LOG_ENABLED:
+                    last = car.get_last()
+                    db.log(
+                        f'created at {target}: {self._vname_arr[target]} '
+                        f'with destination {last}: {self._vname_arr[last]}',
+                        'car', car.id
+                    )
 
     def spawn_passenger(self, target, **kwargs):
         """
@@ -515,41 +731,40 @@ class Net:
         nuffin.
         """
 
-        try:
-            target = int(target)
-        except ValueError:
-            # assume it is vertex name
-            try:
-                target = self.namelup[target]
-            except KeyError:
-                raise KeyError('nonexistant vertex name {}'.format(target))
-        except TypeError:
-            raise TypeError(
-                'target expected to be str or int. '
-                'got {}'.format(type(target))
-            )
+        target = self._resolve(target)
         if 'amount' in kwargs:
             amount = kwargs['amount']
         else:
             amount = 1
+        # a fixed route/destination is the same for every spawned
+        # passenger, so resolve it once outside the loop
+        if 'route' in kwargs:
+            route = kwargs['route']
+        elif 'dst' in kwargs:
+            route = self.get_route(target, kwargs.pop('dst'))
+        else:
+            route = None
         with CurrentDb() as db:
             for _ in range(amount):
-                if 'route' in kwargs:
-                    route = kwargs['route']
-                elif 'dst' in kwargs:
-                    route = self.get_route(target, kwargs.pop('dst'))
+                if route is None:
+                    # draw from [0, nv-1) and shift past `target`:
+                    # uniform over the other vertices, no O(V) copies
+                    dst = int(self._rng.integers(0, self._nv - 1))
+                    dst += dst >= target
+                    pgr = Passenger(self.get_route(target, dst))
                 else:
-                    dst = np.random.choice(
-                        np.delete(self.g.get_vertices(), target)
-                    )
-                    route = self.get_route(target, dst)
-                pgr = Passenger(route)
+                    # routes are immutable, all passengers share the
+                    # storage
+                    pgr = Passenger(route)
                 self.vinside[target].append(pgr)
                 self.allpassengers[pgr.id] = pgr
-                db.log('created at {0}: {1} with destination {2}: {3}'.format(
-                    target, self.vname[target],
-                    pgr.get_last(), self.vname[pgr.get_last()]
-                ), 'pgr', pgr.id)
+                if LOG_ENABLED:
+                    last = pgr.get_last()
+                    db.log(
+                        f'created at {target}: {self._vname_arr[target]} '
+                        f'with destination {last}: {self._vname_arr[last]}',
+                        'pgr', pgr.id
+                    )
 
     def spawn_random_passengers(self, amount):
         """
@@ -566,19 +781,24 @@ class Net:
         """
 
         with CurrentDb() as db:
-            for _ in range(amount):
-                target = np.random.choice(self.g.get_vertices())
-                dst = np.random.choice(
-                    np.delete(self.g.get_vertices(), target)
-                )
+            # draw every endpoint pair in two vectorized calls; dst
+            # comes from [0, nv-1) and shifts past its src, so pairs are
+            # uniform over distinct vertices with no per-spawn rng calls
+            srcs = self._rng.integers(0, self._nv, size=amount)
+            dsts = self._rng.integers(0, self._nv - 1, size=amount)
+            dsts += dsts >= srcs
+            for target, dst in zip(srcs.tolist(), dsts.tolist()):
                 route = self.get_route(target, dst)
                 pgr = Passenger(route)
                 self.vinside[target].append(pgr)
                 self.allpassengers[pgr.id] = pgr
-                db.log('created at {0}: {1} with destination {2}: {3}'.format(
-                    target, self.vname[target],
-                    pgr.get_last(), self.vname[pgr.get_last()]
-                ), 'pgr', pgr.id)
+                if LOG_ENABLED:
+                    last = pgr.get_last()
+                    db.log(
+                        f'created at {target}: {self._vname_arr[target]} '
+                        f'with destination {last}: {self._vname_arr[last]}',
+                        'pgr', pgr.id
+                    )
 
     def ptransfer(self, targets=None, **kwargs):
         """
@@ -615,86 +835,79 @@ class Net:
             # TODO: write docstring
             # check if car full
             if not len(car.inside) >= car.size:
-                if pnextvert in car.route:
+                if car.has_stop(pnextvert):
                     car.inside.append(p)
                     # log message as passenger TODO: move it to
                     # Passenger class somehow
-                    db.log('mounting car {0} at {1}:{2}'.format(
-                        car.id, v, self.vname[v]
-                    ), 'pgr', p.id)
+                    if LOG_ENABLED:
+                        db.log(
+                            f'mounting car {car.id} '
+                            f'at {v}:{self._vname_arr[v]}', 'pgr', p.id
+                        )
                     # break so we don't look for another car for
                     # passenger
                     return True
             else:
                 # log message as passenger
-                db.log('cannot get in car {0}: it is full'.format(
-                    car.id
-                ), 'pgr', p.id)
+                if LOG_ENABLED:
+                    db.log(
+                        f'cannot get in car {car.id}: it is full',
+                        'pgr', p.id
+                    )
                 return False
 
         if targets:
-            try:
-                targets = [int(item) for item in targets]
-            except ValueError:
-                # assume it is vertex name
-                try:
-                    targets = [self.namelup[item] for item in targets]
-                except KeyError:
-                    raise KeyError(
-                        'nonexistant vertex name {}'.format(targets)
-                    )
-            except TypeError:
-                raise TypeError(
-                    'targets expected to be iter(str) or iter(int). '
-                    'got {}'.format(type(targets))
-                )
+            targets = [self._resolve(item) for item in targets]
         else:
-            targets = self.g.get_vertices()
+            targets = self._V
         with CurrentDb() as db:
             for v in targets:
-                ptransfer = np.array([], dtype='object')
                 # get all passengers that need transfer or at final destination
                 # and place them in buffer
+                ptransfer = []
                 for car in self.vontrack[v]:
-                    ptransfer = np.append(
-                        ptransfer,
-                        car.peject(v, database=db)
-                    )
-                for _ in range(len(self.vinside[v])):
-                    p = self.vinside[v].popleft()
+                    ptransfer.extend(car.peject(v, database=db))
+                # bucket waiting cars by their remaining stops once per
+                # vertex, so each passenger only probes cars that can
+                # actually serve its next hop
+                cars_by_stop = {}
+                for car in self.vontrack[v]:
+                    for stop in car.remaining_stops():
+                        cars_by_stop.setdefault(stop, []).append(car)
+                inside = self.vinside[v]
+                staying = []
+                for p in inside:
                     # route item will be popped at arrival to the next vertex
                     pnextvert = p.get_next()
                     if p.namelup:
-                        pnextvert = self.namelup[nextvert]
+                        pnextvert = self.namelup[pnextvert]
                     # check if we arrived to the last stop
                     if pnextvert != v:
                         found = False
-                        for car in self.vontrack[v]:
+                        for car in cars_by_stop.get(pnextvert, ()):
                             found = put_passenger_inside(p, car, v)
                             if found:
                                 break
                         if not found:
-                            # place it back and hope for the best
-                            self.vinside[v].append(p)
+                            # keep it and hope for the best
+                            staying.append(p)
                     else:
                         if 'silent' not in kwargs:
                             print(
-                                'Passenger #{0} at the'
-                                'destination {1}: {2}'.format(
-                                    p.id, v, self.vname[v]
-                                )
+                                f'Passenger #{p.id} at the'
+                                f'destination {v}: {self._vname_arr[v]}'
+                            )
+                        if LOG_ENABLED:
+                            db.log(
+                                f'i am at the destination '
+                                f'{v}: {self._vname_arr[v]}', 'pgr', p.id
                             )
-                        db.log('i am at the destination {0}: {1}'.format(
-                            v, self.vname[v]
-                        ), 'pgr', p.id)
                         self.allpassengers.pop(p.id)
-                # assign all passengers from buffer to vertex
-                if ptransfer.size:
-                    for p in ptransfer:
-                        # newcur = p.get_next()
-                        # p.chcur(newcur, self.vname[newcur])
-                        # p.route.popleft()
-                        self.vinside[v].append(p)
+                inside.clear()
+                inside.extend(staying)
+                # assign all passengers from buffer to vertex with one
+                # C-level bulk append
+                inside.extend(ptransfer)
 
     def getstat(self, what='net', h=False):
         """
@@ -703,7 +916,9 @@ class Net:
         For now can return statistics about graph, cars or passengers.
 
         Array order:
-            net: v, vname, len(vinside), len(vontrack).
+            net: v, vname, len(vinside), len(vontrack). Returned as a
+                structured array with fields ('v', 'vname', 'inside',
+                'ontrack') for cheap column access.
             car: id, cur, route[-1], size, len(inside).
             pgr: id, cur, route[-1].
 
@@ -722,17 +937,28 @@ class Net:
             array with statistics.
         """
 
+        # rows are collected in a list and turned into an array once at
+        # the end; growing with np.append copies the whole array per row
         stat = np.array([])
         if what == 'net':
-            for v in self.g.get_vertices():
-                cols = [
-                    v, self.vname[v], len(self.vinside[v]),
-                    len(self.vontrack[v])
-                ]
-                stat = np.append(stat, cols)
-            if stat:
-                stat = stat.reshape(len(self.g.get_vertices()), len(cols))
+            rows = [
+                (int(v), self._vname_arr[v], len(self.vinside[v]),
+                 len(self.vontrack[v]))
+                for v in self._V
+            ]
+            stat = np.fromiter(
+                rows,
+                dtype=np.dtype([
+                    # the name mirror is already sized to the longest
+                    # vertex name, so reuse its dtype instead of a fixed
+                    # width that would truncate long names
+                    ('v', 'i4'), ('vname', self._vname_arr.dtype),
+                    ('inside', 'i4'), ('ontrack', 'i4')
+                ]),
+                count=len(rows)
+            )
         elif what == 'car':
+            rows = []
             for _, c in self.allcars.items():
                 if h:
                     # make it human readable
@@ -742,40 +968,39 @@ class Net:
                     except ValueError:
                         # car in transition and have `cur` format as `s-t`
                         intransition = True
-                        s_vert, t_vert = c.cur.split('-')
+                        s_vert, t_vert = map(int, c.cur.split('-'))
                     if intransition:
                         ccur = '{0}-{1}'.format(
-                            self.vname[s_vert], self.vname[t_vert]
+                            self._vname_arr[s_vert], self._vname_arr[t_vert]
                         )
                     else:
-                        ccur = self.vname[c.cur]
-                    cols = [
-                        c.id, ccur, self.vname[c.get_next()[0]],
-                        self.vname[c.get_last()], c.size, len(c.inside)
-                    ]
+                        ccur = self._vname_arr[c.cur]
+                    rows.append([
+                        c.id, ccur, self._vname_arr[c.get_next()],
+                        self._vname_arr[c.get_last()], c.size, len(c.inside)
+                    ])
                 else:
-                    cols = [
-                        c.id, c.cur, c.get_next()[0], c.get_last(),
+                    rows.append([
+                        c.id, c.cur, c.get_next(), c.get_last(),
                         c.size, len(c.inside)
-                    ]
-                stat = np.append(stat, cols)
-            if stat.size:
-                stat = stat.reshape(len(self.allcars), len(cols))
+                    ])
+            if rows:
+                stat = np.array(rows, dtype=object)
         elif what == 'pgr':
+            rows = []
             for _, p in self.allpassengers.items():
                 if h:
                     # make it human readable
-                    cols = [
-                        p.id, self.vname[p.cur], self.vname[p.get_next()],
-                        self.vname[p.get_last()]
-                    ]
+                    rows.append([
+                        p.id, self._vname_arr[p.cur], self._vname_arr[p.get_next()],
+                        self._vname_arr[p.get_last()]
+                    ])
                 else:
-                    cols = [
+                    rows.append([
                         p.id, p.cur, p.get_next(), p.get_last()
-                    ]
-                stat = np.append(stat, cols)
-            if stat.size:
-                stat = stat.reshape(len(self.allpassengers), len(cols))
+                    ])
+            if rows:
+                stat = np.array(rows, dtype=object)
         return stat
 
 
@@ -786,9 +1011,10 @@ class Car:
 
     Variables
     ------
-    route: iter(str) or iter(int)
-        route to follow. If `namelup` is True then `cur` is vertex name.
-        Otherwise it is vertex index.
+    _route: list(str) or list(int)
+        route to follow, fixed at construction; `_head` is the cursor of
+        the next stop. If `namelup` is True the stops are vertex names,
+        otherwise vertex indices.
     cur: str or int
         current vertex position. If `namelup` is True then `cur` is vertex
         name.  Otherwise it is vertex index.
@@ -801,17 +1027,20 @@ class Car:
         names, otherwise looks for vertex index
     id: long
         unique identification number of the car.
-    total: [long]
-        `id` that was assigned to the last created car, represents total
-        amount of cars created
-    can_move: bool
-        if True, car can be moved to another vertex. Required for proper car
-        movement restraint during step evaluation
+    _next_id: itertools.count
+        id generator shared by all cars; `next()` on it is a single
+        C-level increment
+    last_moved: int
+        tick number of the car's last move. `Net.move_cars` skips cars
+        already stamped with the current tick, which restrains each car
+        to one move per step
 
     Methods
     ------
     peject:
         returns `Passenger` objects for ejection
+    has_stop:
+        checks if a vertex is among remaining stops in `route`
     get_next:
         attepmts to return next destination in `route`
     take_next:
@@ -822,7 +1051,23 @@ class Car:
         changes `cur` — current location, logs change
     """
 
-    total = [0]
+    # fixed attribute layout: saves the per-instance __dict__ and makes
+    # attribute access a slot load for large car populations
+    __slots__ = ('id', 'size', 'namelup', 'last_moved', 'repeat', 'inside',
+                 'cur', '_route', '_head', '_route_count', '_last')
+
+    _next_id = count()
+
+    @classmethod
+    def reset_ids(cls):
+        """
+        Restarts the shared id counter from zero.
+
+        Call at worker entry when running scenarios in separate processes,
+        so every worker owns an independent id space instead of forking a
+        half-advanced counter.
+        """
+        cls._next_id = count()
 
     def __init__(self, route, size=20, **kwargs):
         """
@@ -851,45 +1096,86 @@ class Car:
             get appended back and never disappear
         """
 
-        self.id = self.total[0]
-        self.total[0] += 1
+        self.id = next(self._next_id)
         self.size = size
         self.namelup = False
-        self.can_move = True
+        # fresh cars have never moved, so any current tick may move them
+        self.last_moved = -1
         self.repeat = False
         if 'inside' in kwargs:
             self.inside = kwargs['inside']
         else:
             self.inside = deque([])
-        # try to convert list elements into deque of vertex indices
-        try:
-            self.route = deque([int(item) for item in route])
-        except ValueError:
-            # assume it is vertex names
-            self.route = route
+        # the route is stored as an immutable list plus a head cursor;
+        # advancing is an integer increment instead of a deque popleft
+        # with its per-node heap traffic. A peek at the first element
+        # picks the name/index variant without the exception round-trip
+        # the old int() probe paid on every name route
+        seq = route if isinstance(route, (list, tuple)) else list(route)
+        if not seq or isinstance(seq[0], (int, np.integer)):
+            self._route = seq
+        elif isinstance(seq[0], str):
+            # vertex names
+            self._route = seq
             self.namelup = True
-        except TypeError:
+        else:
             raise TypeError(
                 'route expected to be iter(str) or iter(int). '
                 'got {}'.format(type(route))
             )
+        if 'repeat' in kwargs:
+            self.repeat = bool(kwargs['repeat'])
+
+        self._head = 0
         if 'cur' in kwargs:
-            try:
-                self.cur = int(kwargs['cur'])
-            except ValueError:
+            cur = kwargs['cur']
+            if isinstance(cur, (int, np.integer)):
+                self.cur = int(cur)
+            elif isinstance(cur, str):
                 # assume it is vertex name
-                self.cur = kwargs['cur']
+                self.cur = cur
                 self.namelup = True
-            except TypeError:
+            else:
                 raise TypeError(
-                    'route expected to be iter(str) or iter(int). '
-                    'got {}'.format(type(route))
+                    'cur expected to be str or int. '
+                    'got {}'.format(type(cur))
                 )
         else:
-            self.cur = self.route.popleft()
+            self.cur = self._route[0]
+            if self.repeat:
+                # the consumed start must leave the cycle, exactly like
+                # the old popleft before append-back rotation: a closed
+                # loop [0, 1, 2, 0] keeps cycling 1, 2, 0, 1, 2, 0, ...
+                # with no duplicated stop at the seam
+                self._route = self._route[1:]
+            else:
+                self._head = 1
 
-        if 'repeat' in kwargs:
-            self.repeat = bool(kwargs['repeat'])
+        # the final destination never changes once the route is set
+        self._last = self._route[-1] if self._route else None
+
+        # remaining-stop multiplicities for O(1) membership checks in
+        # `has_stop`; kept in sync by `take_next`. A circular route
+        # serves every stop on it forever
+        self._route_count = {}
+        stops = self._route if self.repeat else self._route[self._head:]
+        for vert in stops:
+            self._route_count[vert] = self._route_count.get(vert, 0) + 1
+
+    def has_stop(self, vert):
+        """
+        Returns True if `vert` is among the remaining stops in `route`.
+
+        O(1) lookup against the remaining-stop table instead of scanning
+        the route deque.
+        """
+        return vert in self._route_count
+
+    def remaining_stops(self):
+        """
+        Returns a view of the distinct stops remaining in `route`.
+        """
+        return self._route_count.keys()
 
     def peject(self, current, database=None):
         """
@@ -908,8 +1194,8 @@ class Car:
 
         Returns
         ------
-        ptransfer: numpy.ndarray(`Passenger`)
-            an array of `Passenger` objects taken from `inside` attribute.
+        ptransfer: list(`Passenger`)
+            a list of `Passenger` objects taken from `inside` attribute.
         """
 
         if self.cur != current:
@@ -917,23 +1203,35 @@ class Car:
                 'Car #{0} is at unexpected location.'
                 'Expected {1}, got {2}.'.format(self.id, self.cur, current)
             )
-        ejecting = np.array([], dtype='object')
-        # nextvert = self.get_next()
-        for _ in range(len(self.inside)):
-            p = self.inside.popleft()
-            if p.get_next() in self.route:
-                self.inside.append(p)
+        if not self.inside:
+            # most cars are empty on most ticks; make that case one branch
+            return []
+        ejecting = []
+        staying = []
+        # probe the remaining-stop table and the passenger cursor fields
+        # directly: with slotted instances this drops two method frames
+        # per passenger from the hottest loop in the module
+        route_count = self._route_count
+        for p in self.inside:
+            proute = p._route
+            nxt = proute[p._head] if p._head < len(proute) else p.cur
+            if nxt in route_count:
+                staying.append(p)
             else:
-                ejecting = np.append(ejecting, p)
+                ejecting.append(p)
                 # put message in log as passenger
+                if LOG_ENABLED:
+                    database.log(
+                        f'ejected from car {self.id}', 'pgr', p.id
+                    )
+        self.inside = deque(staying)
+        if ejecting:
+            # put message in log as car
+            if LOG_ENABLED:
                 database.log(
-                    'ejected from car {0}'.format(self.id), 'pgr', p.id
+                    f'ejecting passengers: {[p.id for p in ejecting]}',
+                    'car', self.id
                 )
-        if ejecting.size != 0:
-            # put message in log as car
-            database.log('ejecting passengers: {0}'.format(
-                [p.id for p in ejecting]
-            ), 'car', self.id)
         return ejecting
 
     def get_next(self):
@@ -941,21 +1239,27 @@ class Car:
         Attempts to return next destination in `route`. If cannot, returns
         current position.
         """
-        try:
-            nextvert = self.route[0]
-        except IndexError:
-            # nowhere to go - return current station
-            nextvert = self.cur
-        return nextvert
+        if self._head < len(self._route):
+            return self._route[self._head]
+        # nowhere to go - return current station
+        return self.cur
 
     def take_next(self):
         """
         Attempts to take (pop) and return next destination in `route`. If car
-        route is circular, appends taken route vertex back.
+        route is circular, the cursor wraps around and stops never run out.
         """
-        nextvert = self.route.popleft()
+        nextvert = self._route[self._head]
         if self.repeat:
-            self.route.append(nextvert)
+            self._head = (self._head + 1) % len(self._route)
+        else:
+            self._head += 1
+            # keep the remaining-stop table in sync for `has_stop`
+            count = self._route_count[nextvert] - 1
+            if count:
+                self._route_count[nextvert] = count
+            else:
+                del self._route_count[nextvert]
         return nextvert
 
     def get_last(self):
@@ -963,12 +1267,19 @@ class Car:
         Attempts to return last destination in `route`. If cannot, returns
         current position.
         """
-        try:
-            nextvert = self.route[-1]
-        except IndexError:
-            # nowhere to go - return current station
-            nextvert = self.cur
-        return nextvert
+        if self.repeat:
+            # a single-stop loop is empty once the start is consumed —
+            # nowhere to go but the current station, as for open routes
+            if not self._route:
+                return self.cur
+            # the route cycles, the latest taken stop sits behind the
+            # cursor just like the rotated deque used to keep it at [-1];
+            # on a fresh car the negative index lands on the final stop
+            return self._route[self._head - 1]
+        if self._head < len(self._route):
+            return self._last
+        # nowhere to go - return current station
+        return self.cur
 
     def chcur(self, newcur, newcurname=None, update_inside=True,
               database=None):
@@ -992,18 +1303,20 @@ class Car:
             self.cur = newcurname
         else:
             self.cur = newcur
-        for p in self.inside:
-            p.chcur(newcur, newcurname, database=database)
-            if update_inside:
-                p.take_next()
+        if update_inside:
+            # one merged call per passenger instead of chcur + take_next
+            for p in self.inside:
+                p.advance(newcur, newcurname, database=database)
+        else:
+            for p in self.inside:
+                p.chcur(newcur, newcurname, database=database)
         if database:
-            database.log(
-                'i am at {0}: {1}'.format(newcur, newcurname), 'car', self.id
-            )
+            if LOG_ENABLED:
+                database.log(
+                    f'i am at {newcur}: {newcurname}', 'car', self.id
+                )
         else:
-            raise RuntimeWarning(
-                'cannot log message: database cursor is not provided'
-            )
+            _warn_no_database()
 
 
 class Passenger:
@@ -1023,9 +1336,9 @@ class Passenger:
         names, otherwise looks for vertex index.
     id: long
         unique identification number of the passenger.
-    total: [long]
-        `id` that was assigned to the last created passenger, represents total
-        amount of passengers created.
+    _next_id: itertools.count
+        id generator shared by all passengers; `next()` on it is a single
+        C-level increment.
 
     Methods
     ------
@@ -1035,9 +1348,22 @@ class Passenger:
         attempts to return last destination in `route`
     chcur:
         changes `cur` — current location, logs change
+    advance:
+        changes `cur` and pops next destination in one call
     """
 
-    total = [0]
+    # see Car: passengers are the largest population in a run, so the
+    # per-instance __dict__ is the first memory cost to cut
+    __slots__ = ('id', 'namelup', 'cur', '_route', '_head', '_last')
+
+    _next_id = count()
+
+    @classmethod
+    def reset_ids(cls):
+        """
+        Restarts the shared id counter from zero, see `Car.reset_ids`.
+        """
+        cls._next_id = count()
 
     def __init__(self, route, **kwargs):
         """
@@ -1058,62 +1384,63 @@ class Passenger:
             assignment. Default: `route[0]`.
         """
 
-        # assign id and increment total
-        self.id = self.total[0]
-        self.total[0] += 1
+        self.id = next(self._next_id)
         self.namelup = False
-        # try to convert list elements into deque of vertex indices
-        try:
-            self.route = deque([int(item) for item in route])
-        except ValueError:
-            # assume it is vertex names
-            self.route = route
+        # same layout as Car: an immutable route plus a head cursor, so
+        # advancing is an integer increment instead of a deque popleft.
+        # Dispatch on the first element rather than catching ValueError
+        seq = route if isinstance(route, (list, tuple)) else list(route)
+        if not seq or isinstance(seq[0], (int, np.integer)):
+            self._route = seq
+        elif isinstance(seq[0], str):
+            # vertex names
+            self._route = seq
             self.namelup = True
-        except TypeError:
+        else:
             raise TypeError(
                 'route expected to be iter(str) or iter(int). '
                 'got {}'.format(type(route))
             )
+        self._head = 0
+        # the final destination never changes once the route is set
+        self._last = self._route[-1] if self._route else None
         if 'cur' in kwargs:
             self.cur = kwargs['cur']
         else:
-            self.cur = self.route.popleft()
+            self.cur = self._route[0]
+            self._head = 1
 
     def get_next(self):
         """
         Attempts to return next destination in `route`. If cannot, returns
         current position
         """
-        try:
-            nextvert = self.route[0]
-        except IndexError:
-            # nowhere to go - return current station
-            nextvert = self.cur
-        return nextvert
+        if self._head < len(self._route):
+            return self._route[self._head]
+        # nowhere to go - return current station
+        return self.cur
 
     def take_next(self):
         """
         Attempts to take (pop) and return next destination in `route`. If
         cannot, returns current position
         """
-        try:
-            nextvert = self.route.popleft()
-        except IndexError:
-            # nowhere to go - return current station
-            nextvert = self.cur
-        return nextvert
+        if self._head < len(self._route):
+            nextvert = self._route[self._head]
+            self._head += 1
+            return nextvert
+        # nowhere to go - return current station
+        return self.cur
 
     def get_last(self):
         """
         Attempts to return last destination in `route`. If cannot, returns
         current position
         """
-        try:
-            nextvert = self.route[-1]
-        except IndexError:
-            # nowhere to go - return current station
-            nextvert = self.cur
-        return nextvert
+        if self._head < len(self._route):
+            return self._last
+        # nowhere to go - return current station
+        return self.cur
 
     def chcur(self, newcur, newcurname=None, database=None):
         """
@@ -1127,10 +1454,29 @@ class Passenger:
         else:
             self.cur = newcur
         if database:
-            database.log(
-                'i am at {0}: {1}'.format(newcur, newcurname), 'pgr', self.id
-            )
+            if LOG_ENABLED:
+                database.log(
+                    f'i am at {newcur}: {newcurname}', 'pgr', self.id
+                )
         else:
-            raise RuntimeWarning(
-                'cannot log message: database cursor is not provided'
-            )
+            _warn_no_database()
+
+    def advance(self, newcur, newcurname=None, database=None):
+        """
+        Changes `cur` value to a `newcur` and pops the next destination in
+        `route`, equivalent to `chcur` followed by `take_next` but in one
+        call — `Car.chcur` invokes it once per passenger per stop arrival.
+        """
+        if self.namelup and newcurname:
+            self.cur = newcurname
+        else:
+            self.cur = newcur
+        if self._head < len(self._route):
+            self._head += 1
+        if database:
+            if LOG_ENABLED:
+                database.log(
+                    f'i am at {newcur}: {newcurname}', 'pgr', self.id
+                )
+        else:
+            _warn_no_database()